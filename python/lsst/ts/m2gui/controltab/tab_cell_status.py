@@ -66,13 +66,25 @@ class TabCellStatus(TabDefault):
         # Selector of the actuator group
         self._group_data_selector = self._create_group_data_selection()
 
-        # Visible actuator IDs on the cell map
+        # Visible actuator IDs on the cell map, and their indices in the
+        # force arrays. The actuator ID begins from 1 instead of 0.
         self._visible_actuator_ids = self.get_visible_actuator_ids()
+        self._indices_visible_actuators = (
+            np.array(self._visible_actuator_ids, dtype=int) - 1
+        )
 
         self._forces_axial = ActuatorForceAxial()
         self._forces_tangent = ActuatorForceTangent()
 
         self._figures = self._create_figures()
+
+        # Actuator data shown on the figures of axial actuators and tangent
+        # links
+        self._values_figures: list = list()
+
+        # The displacement is shown on the figures or not. The figures begin
+        # with the force.
+        self._is_displacement_figures = False
         self._gauge = Gauge(-1, 1)
 
         # Selector of the actuator
@@ -141,6 +153,9 @@ class TabCellStatus(TabDefault):
         """
 
         self._visible_actuator_ids = self.get_visible_actuator_ids(index)
+        self._indices_visible_actuators = (
+            np.array(self._visible_actuator_ids, dtype=int) - 1
+        )
         for actuator in self._view_mirror.actuators:
             actuator.setVisible(actuator.acutator_id in self._visible_actuator_ids)
 
@@ -350,20 +365,31 @@ class TabCellStatus(TabDefault):
             otherwise, False.
         """
 
-        # Update the figures of force actuator
-        num_axial_actuator = NUM_ACTUATOR - NUM_TANGENT_LINK
+        # Update the figures of force actuator. The series are rebuilt in
+        # update_data(), so skip them if the data is not changed.
+        if values != self._values_figures:
+            self._values_figures = values
+
+            num_axial_actuator = NUM_ACTUATOR - NUM_TANGENT_LINK
 
-        list_x_axial = range(1, num_axial_actuator + 1)
-        self._figures["axial"].update_data(list_x_axial, values[:num_axial_actuator])
+            list_x_axial = range(1, num_axial_actuator + 1)
+            self._figures["axial"].update_data(
+                list_x_axial, values[:num_axial_actuator]
+            )
 
-        list_x_tangent = range(num_axial_actuator + 1, NUM_ACTUATOR + 1)
-        self._figures["tangent"].update_data(list_x_tangent, values[-NUM_TANGENT_LINK:])
+            list_x_tangent = range(num_axial_actuator + 1, NUM_ACTUATOR + 1)
+            self._figures["tangent"].update_data(
+                list_x_tangent, values[-NUM_TANGENT_LINK:]
+            )
 
-        for figure_type in ("axial", "tangent"):
-            if is_displacement:
-                self._figures[figure_type].axis_y.setTitleText("Position (mm)")
-            else:
-                self._figures[figure_type].axis_y.setTitleText("Force (N)")
+        # Setting the title re-lays out the axis, so only do it when the type
+        # of data is changed
+        if is_displacement != self._is_displacement_figures:
+            self._is_displacement_figures = is_displacement
+
+            title = "Position (mm)" if is_displacement else "Force (N)"
+            for figure_type in ("axial", "tangent"):
+                self._figures[figure_type].axis_y.setTitleText(title)
 
     @asyncSlot()
     async def _callback_time_out(self, threshold: float | int = 50) -> None:
@@ -377,22 +403,15 @@ class TabCellStatus(TabDefault):
         """
 
         # Cell map
-        forces_current = self._forces_axial.f_cur + self._forces_tangent.f_cur
-
-        force_current_min = -1.0
-        force_current_max = 1.0
-        for actuator, force_current in zip(self._view_mirror.actuators, forces_current):
-            if actuator.acutator_id in self._visible_actuator_ids:
-                actuator.update_magnitude(
-                    force_current, self._gauge.min, self._gauge.max
-                )
-
-                # Check the range of current forces
-                if force_current < force_current_min:
-                    force_current_min = force_current
+        forces_current = np.array(self._forces_axial.f_cur + self._forces_tangent.f_cur)
+        self._view_mirror.update_magnitudes(
+            forces_current, self._gauge.min, self._gauge.max
+        )
 
-                elif force_current > force_current_max:
-                    force_current_max = force_current
+        # Check the range of current forces of the visible actuators
+        forces_visible = forces_current[self._indices_visible_actuators]
+        force_current_min = float(forces_visible.min(initial=-1.0))
+        force_current_max = float(forces_visible.max(initial=1.0))
 
         # Check we need to update the gauge or not
         if (abs(self._gauge.min - force_current_min) > threshold) or (
@@ -476,12 +495,14 @@ class TabCellStatus(TabDefault):
         aliases = list(self.model.get_actuator_default_status(False))
 
         # Axial actuators
-        idx_alias = 0
-        for id_axial, location in enumerate(cell_geometry["locAct_axial"]):
-            self._view_mirror.add_item_actuator(
-                id_axial + 1, aliases[idx_alias], location[0], location[1]
-            )
-            idx_alias += 1
+        locations_axial = np.array(cell_geometry["locAct_axial"])
+        num_axial_actuator = len(locations_axial)
+        self._view_mirror.add_item_actuators(
+            range(1, num_axial_actuator + 1),
+            aliases[:num_axial_actuator],
+            locations_axial[:, 0],
+            locations_axial[:, 1],
+        )
 
         # Tangential actuators
         degree_tangent = cell_geometry["locAct_tangent"]
@@ -492,9 +513,9 @@ class TabCellStatus(TabDefault):
         list_x = radius * np.cos(angles)
         list_y = radius * np.sin(angles)
 
-        for id_tangent, x, y in zip(list_id_tangent, list_x, list_y):
-            self._view_mirror.add_item_actuator(id_tangent, aliases[idx_alias], x, y)
-            idx_alias += 1
+        self._view_mirror.add_item_actuators(
+            list_id_tangent, aliases[num_axial_actuator:], list_x, list_y
+        )
 
     def _set_signal_detailed_force(
         self, signal_detailed_force: SignalDetailedForce
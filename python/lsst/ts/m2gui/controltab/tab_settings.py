@@ -33,6 +33,7 @@ from lsst.ts.guitool import (
     TIMEOUT_MINIMUM,
     create_double_spin_box,
     create_group_box,
+    prompt_dialog_warning,
     run_command,
     set_button,
 )
@@ -41,9 +42,12 @@ from lsst.ts.m2com import (
     NUM_TEMPERATURE_INTAKE,
     NUM_TEMPERATURE_RING,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QLocale, Qt
+from PySide6.QtGui import QIntValidator, QShowEvent
 from PySide6.QtWidgets import (
+    QAbstractSpinBox,
     QCheckBox,
+    QDoubleSpinBox,
     QFormLayout,
     QGroupBox,
     QHBoxLayout,
@@ -86,11 +90,121 @@ class TabSettings(TabDefault):
     EXTERNAL_ELEVATION_ANGLE_MINIMUM = 0.0
     EXTERNAL_ELEVATION_ANGLE_MAXIMUM = 90.0
 
+    # Ranges (minimum, maximum) of the spin boxes
+    RANGE_PORT = (PORT_MINIMUM, PORT_MAXIMUM)
+    RANGE_ANGLE_DIFFERENCE = (ANGLE_DIFFERENCE_MINIMUM, ANGLE_DIFFERENCE_MAXIMUM)
+    RANGE_LOG_LEVEL = (LOG_LEVEL_MINIMUM, LOG_LEVEL_MAXIMUM)
+    RANGE_REFRESH_FREQUENCY = (REFRESH_FREQUENCY_MINIMUM, REFRESH_FREQUENCY_MAXIMUM)
+    RANGE_POINT_SIZE = (POINT_SIZE_MINIMUM, POINT_SIZE_MAXIMUM)
+
+    # Keyword arguments of create_double_spin_box()
+    _KWARGS_TEMPERATURE_REFERENCE = dict(
+        maximum=TEMPERATURE_REFERENCE_MAXIMUM, minimum=TEMPERATURE_REFERENCE_MINIMUM
+    )
+    _KWARGS_EXTERNAL_ELEVATION_ANGLE = dict(
+        maximum=EXTERNAL_ELEVATION_ANGLE_MAXIMUM,
+        minimum=EXTERNAL_ELEVATION_ANGLE_MINIMUM,
+    )
+    _KWARGS_ILC_TIMEOUT = dict(
+        tool_tip="Timeout to transtion the ILC to Enabled state."
+    )
+
+    # Value of the unchecked state of check box
+    _STATE_UNCHECKED = Qt.CheckState.Unchecked.value
+
+    # Configurations of the settings: (key, value). They are applied in
+    # _create_settings() and shared by all the instances.
+    _RANGES = (
+        ("max_angle_difference", RANGE_ANGLE_DIFFERENCE),
+        ("log_level", RANGE_LOG_LEVEL),
+        ("refresh_frequency", RANGE_REFRESH_FREQUENCY),
+        ("point_size", RANGE_POINT_SIZE),
+    )
+    _SUFFIXES = (
+        ("timeout_connection", " sec"),
+        ("max_angle_difference", " degree"),
+        ("refresh_frequency", " Hz"),
+    )
+    _TOOL_TIPS = (
+        (
+            "enable_lut_temperature",
+            "Enable the calculation of temperature look-up table (LUT) or not.",
+        ),
+        (
+            "use_external_elevation_angle",
+            (
+                "Use the external elevation angle such as MTMount\n"
+                "to do the look-up table (LUT) calculation or not."
+            ),
+        ),
+        (
+            "enable_angle_comparison",
+            (
+                "Enable the comparison between the external and internal\n"
+                "angles or not. If the external angle is used, this value\n"
+                "will be True to protect the mirror."
+            ),
+        ),
+        (
+            "max_angle_difference",
+            "Maximum allowed difference between the internal and external anlges.",
+        ),
+        ("ilc_retry_times", "Retry times to transtion the ILC to Enabled state."),
+        (
+            "log_level",
+            "CRITICAL (50), ERROR (40), WARNING (30), INFO (20), DEBUG (10)",
+        ),
+        ("refresh_frequency", "Frequency to refresh the data on tables"),
+        ("point_size", "Point size of the application."),
+    )
+
+    # Temperature offsets of the intake and exhaust in degree C
+    TEMPERATURE_OFFSET_INTAKE = (0.0,) * NUM_TEMPERATURE_INTAKE
+    TEMPERATURE_OFFSET_EXHAUST = (0.0,) * NUM_TEMPERATURE_EXHAUST
+
     def __init__(self, title: str, model: Model) -> None:
         super().__init__(title, model)
 
+        self._app = QApplication.instance()
+
         self._settings = self._create_settings()
 
+        # Bind the setting widgets used by the callbacks and layout
+        self._host: QLineEdit = self._settings["host"]
+        self._port_command: QLineEdit = self._settings["port_command"]
+        self._port_telemetry: QLineEdit = self._settings["port_telemetry"]
+        self._timeout_connection: QSpinBox = self._settings["timeout_connection"]
+        self._enable_lut_temperature: QCheckBox = self._settings[
+            "enable_lut_temperature"
+        ]
+        self._use_external_elevation_angle: QCheckBox = self._settings[
+            "use_external_elevation_angle"
+        ]
+        self._enable_angle_comparison: QCheckBox = self._settings[
+            "enable_angle_comparison"
+        ]
+        self._max_angle_difference: QSpinBox = self._settings["max_angle_difference"]
+        self._lut_temperature_ref: QDoubleSpinBox = self._settings[
+            "lut_temperature_ref"
+        ]
+        self._external_elevation_angle: QDoubleSpinBox = self._settings[
+            "external_elevation_angle"
+        ]
+        self._ilc_retry_times: QSpinBox = self._settings["ilc_retry_times"]
+        self._ilc_timeout: QDoubleSpinBox = self._settings["ilc_timeout"]
+        self._log_level: QSpinBox = self._settings["log_level"]
+        self._refresh_frequency: QSpinBox = self._settings["refresh_frequency"]
+        self._point_size: QSpinBox = self._settings["point_size"]
+
+        # The callback is synchronous and uses the widget attributes above, so
+        # connect it after they are bound and sync with the default state
+        self._use_external_elevation_angle.stateChanged.connect(
+            self._callback_use_external_elevation_angle
+        )
+        self._callback_use_external_elevation_angle(
+            self._use_external_elevation_angle.checkState().value
+        )
+
         self._button_apply_host = set_button(
             "Apply Host Settings", self._callback_apply_host
         )
@@ -134,128 +248,112 @@ class TabSettings(TabDefault):
             "Apply General Settings", self._callback_apply_general
         )
 
+        # Overwrite the external elevation angle or not. This is updated when
+        # the overwrite button is toggled.
+        self._overwrite_active = False
+
+        # Writing of the external elevation angle is in progress or not
+        self._is_overwriting = False
+
         # Timer to write the external elevation angle continuously
         self._timer = self.create_and_start_timer(
             self._callback_time_out, self.model.duration_refresh
         )
 
-        self.set_widget_and_layout()
+        # The layout is created when the table is shown for the first time
+        self._is_layout_created = False
 
         self._set_signal_config(self.model.signal_config)
 
     def _create_settings(self) -> dict:
         """Create the settings.
 
+        No signal is connected here, so setting the default values does not
+        trigger any callback. Connect the signals after this function.
+
         Returns
         -------
         `dict`
             Settings.
         """
 
+        # Let Qt own the widgets from the beginning
+        parent = self.widget()
+
         settings = {
-            "host": QLineEdit(),
-            "port_command": QSpinBox(),
-            "port_telemetry": QSpinBox(),
-            "timeout_connection": QSpinBox(),
-            "enable_lut_temperature": QCheckBox("Enable the temperature LUT"),
-            "use_external_elevation_angle": QCheckBox("Use external elevation angle"),
-            "enable_angle_comparison": QCheckBox("Enable angle comparison"),
-            "max_angle_difference": QSpinBox(),
+            "host": QLineEdit(parent),
+            "port_command": QLineEdit(parent),
+            "port_telemetry": QLineEdit(parent),
+            "timeout_connection": QSpinBox(parent),
+            "enable_lut_temperature": QCheckBox("Enable the temperature LUT", parent),
+            "use_external_elevation_angle": QCheckBox(
+                "Use external elevation angle", parent
+            ),
+            "enable_angle_comparison": QCheckBox("Enable angle comparison", parent),
+            "max_angle_difference": QSpinBox(parent),
             "lut_temperature_ref": create_double_spin_box(
-                "degree C",
-                1,
-                maximum=self.TEMPERATURE_REFERENCE_MAXIMUM,
-                minimum=self.TEMPERATURE_REFERENCE_MINIMUM,
+                "degree C", 1, **self._KWARGS_TEMPERATURE_REFERENCE
             ),
             "external_elevation_angle": create_double_spin_box(
-                "degree",
-                1,
-                maximum=self.EXTERNAL_ELEVATION_ANGLE_MAXIMUM,
-                minimum=self.EXTERNAL_ELEVATION_ANGLE_MINIMUM,
-            ),
-            "ilc_retry_times": QSpinBox(),
-            "ilc_timeout": create_double_spin_box(
-                "sec", 2, tool_tip="Timeout to transtion the ILC to Enabled state."
+                "degree", 1, **self._KWARGS_EXTERNAL_ELEVATION_ANGLE
             ),
-            "log_level": QSpinBox(),
-            "refresh_frequency": QSpinBox(),
-            "point_size": QSpinBox(),
+            "ilc_retry_times": QSpinBox(parent),
+            "ilc_timeout": create_double_spin_box("sec", 2, **self._KWARGS_ILC_TIMEOUT),
+            "log_level": QSpinBox(parent),
+            "refresh_frequency": QSpinBox(parent),
+            "point_size": QSpinBox(parent),
         }
 
+        # Only emit the valueChanged signal when the editing is finished
+        # instead of on every keystroke
+        for widget in settings.values():
+            if isinstance(widget, QAbstractSpinBox):
+                widget.setKeyboardTracking(False)
+
+        # The ports are typed or pasted, so the line edit with a validator is
+        # enough and lighter than the spin box. The group separator such as
+        # "1,000" is rejected, so the accepted text can be converted by int().
+        locale_port = QLocale()
+        locale_port.setNumberOptions(
+            locale_port.numberOptions() | QLocale.NumberOption.RejectGroupSeparator
+        )
         for port in ("port_command", "port_telemetry"):
-            settings[port].setRange(PORT_MINIMUM, PORT_MAXIMUM)
+            validator = QIntValidator(*self.RANGE_PORT, settings[port])
+            validator.setLocale(locale_port)
+            settings[port].setValidator(validator)
 
         settings["timeout_connection"].setMinimum(TIMEOUT_MINIMUM)
-        settings["timeout_connection"].setSuffix(" sec")
-
-        settings["enable_lut_temperature"].setToolTip(
-            "Enable the calculation of temperature look-up table (LUT) or not."
-        )
-        settings["use_external_elevation_angle"].setToolTip(
-            (
-                "Use the external elevation angle such as MTMount\n"
-                "to do the look-up table (LUT) calculation or not."
-            )
-        )
-        settings["use_external_elevation_angle"].stateChanged.connect(
-            self._callback_use_external_elevation_angle
-        )
-
-        settings["enable_angle_comparison"].setToolTip(
-            (
-                "Enable the comparison between the external and internal\n"
-                "angles or not. If the external angle is used, this value\n"
-                "will be True to protect the mirror."
-            )
-        )
-
-        settings["max_angle_difference"].setToolTip(
-            "Maximum allowed difference between the internal and external anlges."
-        )
-
-        settings["max_angle_difference"].setRange(
-            self.ANGLE_DIFFERENCE_MINIMUM, self.ANGLE_DIFFERENCE_MAXIMUM
-        )
-        settings["max_angle_difference"].setSuffix(" degree")
-
-        settings["ilc_retry_times"].setToolTip(
-            "Retry times to transtion the ILC to Enabled state."
-        )
 
-        settings["log_level"].setRange(LOG_LEVEL_MINIMUM, LOG_LEVEL_MAXIMUM)
-        settings["log_level"].setToolTip(
-            "CRITICAL (50), ERROR (40), WARNING (30), INFO (20), DEBUG (10)"
-        )
+        for key, value_range in self._RANGES:
+            settings[key].setRange(*value_range)
 
-        settings["refresh_frequency"].setRange(
-            REFRESH_FREQUENCY_MINIMUM, REFRESH_FREQUENCY_MAXIMUM
-        )
-        settings["refresh_frequency"].setSuffix(" Hz")
-        settings["refresh_frequency"].setToolTip(
-            "Frequency to refresh the data on tables"
-        )
+        for key, suffix in self._SUFFIXES:
+            settings[key].setSuffix(suffix)
 
-        settings["point_size"].setRange(POINT_SIZE_MINIMUM, POINT_SIZE_MAXIMUM)
-        settings["point_size"].setToolTip("Point size of the application.")
+        for key, tool_tip in self._TOOL_TIPS:
+            settings[key].setToolTip(tool_tip)
 
         # Set the default values
         controller = self.model.controller
-        settings["host"].setText(controller.host)
-        settings["port_command"].setValue(controller.port_command)
-        settings["port_telemetry"].setValue(controller.port_telemetry)
+        for key, value in (
+            ("host", controller.host),
+            ("port_command", controller.port_command),
+            ("port_telemetry", controller.port_telemetry),
+        ):
+            settings[key].setText(str(value))
+
         settings["timeout_connection"].setValue(controller.timeout_connection)
 
-        settings["enable_lut_temperature"].setChecked(
-            controller.control_parameters["enable_lut_temperature"]
-        )
-        settings["use_external_elevation_angle"].setChecked(
-            controller.control_parameters["use_external_elevation_angle"]
-        )
-        settings["enable_angle_comparison"].setChecked(
-            controller.control_parameters["enable_angle_comparison"]
-        )
+        control_parameters = controller.control_parameters
+        for key in (
+            "enable_lut_temperature",
+            "use_external_elevation_angle",
+            "enable_angle_comparison",
+        ):
+            settings[key].setChecked(control_parameters[key])
+
         settings["max_angle_difference"].setValue(
-            controller.control_parameters["max_angle_difference"]
+            control_parameters["max_angle_difference"]
         )
 
         settings["ilc_retry_times"].setValue(self.model.ilc_retry_times)
@@ -264,18 +362,14 @@ class TabSettings(TabDefault):
         settings["log_level"].setValue(self.model.log.level)
 
         # The unit of self.model.duration_refresh is milliseconds
-        frequency = int(1000 / self.model.duration_refresh)
+        frequency = 1000 // max(self.model.duration_refresh, 1)
         settings["refresh_frequency"].setValue(frequency)
 
-        app = QApplication.instance()
-        settings["point_size"].setValue(app.font().pointSize())
-
-        self._set_minimum_width_line_edit(settings["host"])
+        settings["point_size"].setValue(self._app.font().pointSize())
 
         return settings
 
-    @asyncSlot()
-    async def _callback_use_external_elevation_angle(self, state: int) -> None:
+    def _callback_use_external_elevation_angle(self, state: int) -> None:
         """Callback of the check box to use the external elevation angle.
 
         Parameters
@@ -284,15 +378,12 @@ class TabSettings(TabDefault):
             Check state.
         """
 
-        check_box_enable_angle_comparison = self._settings["enable_angle_comparison"]
-
-        check_state = Qt.CheckState(state)
-        if check_state == Qt.CheckState.Unchecked:
-            check_box_enable_angle_comparison.setEnabled(True)
+        if state == self._STATE_UNCHECKED:
+            self._enable_angle_comparison.setEnabled(True)
 
         else:
-            check_box_enable_angle_comparison.setChecked(True)
-            check_box_enable_angle_comparison.setEnabled(False)
+            self._enable_angle_comparison.setChecked(True)
+            self._enable_angle_comparison.setEnabled(False)
 
     def _set_minimum_width_line_edit(
         self, line_edit: QLineEdit, offset: int = 20
@@ -308,9 +399,7 @@ class TabSettings(TabDefault):
         """
 
         font_metrics = line_edit.fontMetrics()
-
-        text = line_edit.text()
-        width = font_metrics.boundingRect(text).width()
+        width = font_metrics.horizontalAdvance(line_edit.text())
         line_edit.setMinimumWidth(width + offset)
 
     @asyncSlot()
@@ -318,40 +407,56 @@ class TabSettings(TabDefault):
         """Callback of the apply-host-setting button. This will apply the
         new host settings to model."""
 
-        host = self._settings["host"].text()
-        port_command = self._settings["port_command"].value()
-        port_telemetry = self._settings["port_telemetry"].value()
-        timeout_connection = self._settings["timeout_connection"].value()
+        for port in (self._port_command, self._port_telemetry):
+            if not port.hasAcceptableInput():
+                await prompt_dialog_warning(
+                    "_callback_apply_host()",
+                    (
+                        f"The port should be in [{PORT_MINIMUM}, {PORT_MAXIMUM}]: "
+                        f"{port.text()!r}."
+                    ),
+                )
+                return
+
+        # Snapshot the values at the time of click
+        connection_information = (
+            self._host.text(),
+            int(self._port_command.text()),
+            int(self._port_telemetry.text()),
+            self._timeout_connection.value(),
+        )
+
+        # Nothing to do if the values are the same as the current ones. When
+        # connected, let the model tell the user to disconnect first.
+        controller = self.model.controller
+        is_unchanged = connection_information == (
+            controller.host,
+            controller.port_command,
+            controller.port_telemetry,
+            controller.timeout_connection,
+        )
+        if is_unchanged and (not self.model.system_status["isCrioConnected"]):
+            return
 
         await run_command(
-            self.model.update_connection_information,
-            host,
-            port_command,
-            port_telemetry,
-            timeout_connection,
+            self.model.update_connection_information, *connection_information
         )
 
-    @asyncSlot()
-    async def _callback_apply_control_parameters(self) -> None:
+    def _callback_apply_control_parameters(self) -> None:
         """Callback of the apply-control-parameters button. The main target is
         to set the elevation angle used in the look-up table (LUT) calculation
         and decide to calculate the temperature LUT or not.
         """
 
-        self.model.controller.control_parameters["enable_lut_temperature"] = (
-            self._settings["enable_lut_temperature"].isChecked()
+        controller = self.model.controller
+        controller.control_parameters["enable_lut_temperature"] = (
+            self._enable_lut_temperature.isChecked()
         )
 
-        use_external_elevation_angle = self._settings[
-            "use_external_elevation_angle"
-        ].isChecked()
-        max_angle_difference = self._settings["max_angle_difference"].value()
-        enable_angle_comparison = self._settings["enable_angle_comparison"].isChecked()
-
-        self.model.controller.select_inclination_source(
-            use_external_elevation_angle=use_external_elevation_angle,
-            max_angle_difference=max_angle_difference,
-            enable_angle_comparison=enable_angle_comparison,
+        controller.select_inclination_source(
+            use_external_elevation_angle=self._use_external_elevation_angle.isChecked(),
+            max_angle_difference=self._max_angle_difference.value(),
+            enable_angle_comparison=self._enable_angle_comparison.isChecked(),
         )
 
     @asyncSlot()
@@ -360,61 +465,115 @@ class TabSettings(TabDefault):
         value used in the calculation of look-up table (LUT).
         """
 
-        ref = self._settings["lut_temperature_ref"].value()
+        ref = self._lut_temperature_ref.value()
         await run_command(
             self.model.controller.set_temperature_offset,
             [ref] * NUM_TEMPERATURE_RING,
-            [0.0] * NUM_TEMPERATURE_INTAKE,
-            [0.0] * NUM_TEMPERATURE_EXHAUST,
+            list(self.TEMPERATURE_OFFSET_INTAKE),
+            list(self.TEMPERATURE_OFFSET_EXHAUST),
         )
 
-    @asyncSlot()
-    async def _callback_overwrite_external_elevation_angle(self) -> None:
+    def _callback_overwrite_external_elevation_angle(self) -> None:
         """Callback of overwrite-external-elevation-angle button. This will
         overwrite the current external elevation angle in controller.
         """
 
-        is_checked = self._button_overwrite_external_elevation_angle.isChecked()
-        if is_checked:
+        self._overwrite_active = (
+            self._button_overwrite_external_elevation_angle.isChecked()
+        )
+        if self._overwrite_active:
             self.model.log.info("Overwrite the external elevation angle continuously.")
         else:
             self.model.log.info("Stop to overwrite the external elevation angle.")
 
-    @asyncSlot()
-    async def _callback_apply_ilc(self) -> None:
+    def _callback_apply_ilc(self) -> None:
         """Callback of the apply-ilc-settings button. This will apply the
         new inner-loop controller (ILC) settings to model."""
 
-        self.model.ilc_retry_times = int(self._settings["ilc_retry_times"].value())
-        self.model.ilc_timeout = self._settings["ilc_timeout"].value()
+        self.model.ilc_retry_times = int(self._ilc_retry_times.value())
+        self.model.ilc_timeout = self._ilc_timeout.value()
 
-    @asyncSlot()
-    async def _callback_apply_general(self) -> None:
+    def _callback_apply_general(self) -> None:
         """Callback of the apply-general-settings button. This will apply the
         new general settings to model."""
 
-        self.model.log.setLevel(self._settings["log_level"].value())
+        # Setting the level clears the cache of all the loggers, so only
+        # do it when the level changes.
+        log_level = self._log_level.value()
+        if self.model.log.level != log_level:
+            self.model.log.setLevel(log_level)
 
         # The unit of self.model.duration_refresh is milliseconds
-        self.model.duration_refresh = int(
-            1000 / self._settings["refresh_frequency"].value()
-        )
+        self.model.duration_refresh = 1000 // max(self._refresh_frequency.value(), 1)
+
+        # Update the point size. Setting the application font re-polishes
+        # all the widgets, so only do it when the point size changes.
+        point_size = self._point_size.value()
+        font = self._app.font()
+        if font.pointSize() != point_size:
+            font.setPointSize(point_size)
+            self._app.setFont(font)
+
+    def _callback_time_out(self) -> None:
+        """Callback timeout function to write the external elevation angle.
+
+        The asynchronous writing is only scheduled when the overwriting is
+        active and the previous writing is done. Otherwise, only the timer
+        is checked.
+        """
 
-        # Update the point size
-        app = QApplication.instance()
-        font = app.font()
-        font.setPointSize(self._settings["point_size"].value())
-        app.setFont(font)
+        if self._overwrite_active and (not self._is_overwriting):
+            # Set the flag when the writing is scheduled instead of when the
+            # task starts, so the next timeout can not schedule another one
+            # in between
+            self._is_overwriting = True
+            self._overwrite_external_elevation_angle()
+
+        self.check_duration_and_restart_timer(self._timer, self.model.duration_refresh)
 
     @asyncSlot()
-    async def _callback_time_out(self) -> None:
-        """Callback timeout function to write the external elevation angle."""
+    async def _overwrite_external_elevation_angle(self) -> None:
+        """Overwrite the external elevation angle in controller.
 
-        if self._button_overwrite_external_elevation_angle.isChecked():
-            angle = self._settings["external_elevation_angle"].value()
+        The self._is_overwriting is set by the caller before this is
+        scheduled, and is reset when the writing is done.
+        """
+
+        try:
+            angle = self._external_elevation_angle.value()
             await run_command(self.model.controller.set_external_elevation_angle, angle)
+        finally:
+            self._is_overwriting = False
 
-        self.check_duration_and_restart_timer(self._timer, self.model.duration_refresh)
+    def showEvent(self, event: QShowEvent) -> None:
+        """This is an overridden function to size the host line edit and
+        create the layout when the table is shown for the first time.
+
+        Parameters
+        ----------
+        event : `PySide6.QtGui.QShowEvent`
+            Show event.
+        """
+
+        if not self._is_layout_created:
+            # The text is only measured when it is going to be displayed
+            self._set_minimum_width_line_edit(self._host)
+
+            # Repaint once after all the groups are added
+            self.setUpdatesEnabled(False)
+            try:
+                self.set_widget_and_layout()
+
+                # Calculate the geometry once before the repaint
+                layout = self.widget().layout()
+                if layout is not None:
+                    layout.activate()
+            finally:
+                self.setUpdatesEnabled(True)
+
+            self._is_layout_created = True
+
+        super().showEvent(event)
 
     def create_layout(self) -> QHBoxLayout:
         """Create the layout.
@@ -456,10 +615,10 @@ class TabSettings(TabDefault):
         layout = QVBoxLayout()
 
         layout_tcpip = QFormLayout()
-        layout_tcpip.addRow("Host name:", self._settings["host"])
-        layout_tcpip.addRow("Commmand port:", self._settings["port_command"])
-        layout_tcpip.addRow("Telemetry port:", self._settings["port_telemetry"])
-        layout_tcpip.addRow("Connection timeout:", self._settings["timeout_connection"])
+        layout_tcpip.addRow("Host name:", self._host)
+        layout_tcpip.addRow("Command port:", self._port_command)
+        layout_tcpip.addRow("Telemetry port:", self._port_telemetry)
+        layout_tcpip.addRow("Connection timeout:", self._timeout_connection)
 
         layout.addLayout(layout_tcpip)
         layout.addWidget(self._button_apply_host)
@@ -478,12 +637,10 @@ class TabSettings(TabDefault):
         layout = QVBoxLayout()
 
         layout_control = QFormLayout()
-        layout_control.addRow(self._settings["enable_lut_temperature"])
-        layout_control.addRow(self._settings["use_external_elevation_angle"])
-        layout_control.addRow(self._settings["enable_angle_comparison"])
-        layout_control.addRow(
-            "Maximum angle difference:", self._settings["max_angle_difference"]
-        )
+        layout_control.addRow(self._enable_lut_temperature)
+        layout_control.addRow(self._use_external_elevation_angle)
+        layout_control.addRow(self._enable_angle_comparison)
+        layout_control.addRow("Maximum angle difference:", self._max_angle_difference)
 
         layout.addLayout(layout_control)
         layout.addWidget(self._button_apply_control_parameters)
@@ -502,12 +659,8 @@ class TabSettings(TabDefault):
         layout = QVBoxLayout()
 
         layout_lut = QFormLayout()
-        layout_lut.addRow(
-            "Temperature reference:", self._settings["lut_temperature_ref"]
-        )
-        layout_lut.addRow(
-            "External elevation angle", self._settings["external_elevation_angle"]
-        )
+        layout_lut.addRow("Temperature reference:", self._lut_temperature_ref)
+        layout_lut.addRow("External elevation angle", self._external_elevation_angle)
 
         layout.addLayout(layout_lut)
         layout.addWidget(self._button_apply_temperature_reference)
@@ -527,8 +680,8 @@ class TabSettings(TabDefault):
         layout = QVBoxLayout()
 
         layout_ilc = QFormLayout()
-        layout_ilc.addRow("Retry times:", self._settings["ilc_retry_times"])
-        layout_ilc.addRow("Timeout:", self._settings["ilc_timeout"])
+        layout_ilc.addRow("Retry times:", self._ilc_retry_times)
+        layout_ilc.addRow("Timeout:", self._ilc_timeout)
 
         layout.addLayout(layout_ilc)
         layout.addWidget(self._button_apply_ilc)
@@ -547,9 +700,9 @@ class TabSettings(TabDefault):
         layout = QVBoxLayout()
 
         layout_app = QFormLayout()
-        layout_app.addRow("Point size:", self._settings["point_size"])
-        layout_app.addRow("Logging level:", self._settings["log_level"])
-        layout_app.addRow("Refresh frequency:", self._settings["refresh_frequency"])
+        layout_app.addRow("Point size:", self._point_size)
+        layout_app.addRow("Logging level:", self._log_level)
+        layout_app.addRow("Refresh frequency:", self._refresh_frequency)
 
         layout.addLayout(layout_app)
         layout.addWidget(self._button_apply_general)
@@ -570,8 +723,7 @@ class TabSettings(TabDefault):
             self._callback_signal_config_temperature_offset
         )
 
-    @asyncSlot()
-    async def _callback_signal_config_temperature_offset(
+    def _callback_signal_config_temperature_offset(
         self, temperature_offset: float
     ) -> None:
         """Callback of the config signal for the temperature offset.
@@ -582,4 +734,4 @@ class TabSettings(TabDefault):
             Temperature offset used in the look-up table calculation. The unit
             is degree C.
         """
-        self._settings["lut_temperature_ref"].setValue(temperature_offset)
+        self._lut_temperature_ref.setValue(temperature_offset)
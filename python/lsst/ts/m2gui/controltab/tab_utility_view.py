@@ -21,6 +21,8 @@
 
 __all__ = ["TabUtilityView"]
 
+from functools import partial
+
 from lsst.ts.guitool import (
     ButtonStatus,
     create_group_box,
@@ -30,7 +32,7 @@ from lsst.ts.guitool import (
     update_button_color,
 )
 from lsst.ts.xml.enums import MTM2
-from PySide6.QtGui import QPalette
+from PySide6.QtGui import QPalette, QShowEvent
 from PySide6.QtWidgets import (
     QFormLayout,
     QGroupBox,
@@ -81,7 +83,24 @@ class TabUtilityView(TabDefault):
             "inclinometer_tma": create_label(),
         }
 
+        # Labels of the calibrated powers: (key, label, unit) of the voltage
+        # and current. The key is the name of power system.
+        self._labels_power = {
+            name: tuple(
+                (key, self._power_inclinometer[key], unit)
+                for key, unit in (
+                    (f"power_voltage_{name}", "V"),
+                    (f"power_current_{name}", "A"),
+                )
+            )
+            for name in ("motor", "communication")
+        }
+
         self._breakers = self._create_indicators_breaker()
+
+        # Breakers are triggered or not. This is the status shown on the
+        # indicators.
+        self._breakers_triggered = {name: False for name in self._breakers.keys()}
         self._button_reset_breakers_motor = set_button(
             "Reset Breakers (Motor)",
             self._callback_reset_breakers,
@@ -101,7 +120,54 @@ class TabUtilityView(TabDefault):
             self.model.utility_monitor.displacements
         )
 
-        self.set_widget_and_layout(is_scrollable=True)
+        # The sensors in each temperature group and displacement direction are
+        # fixed, so look them up only once
+        utility_monitor = self.model.utility_monitor
+        self._sensors_temperature = {
+            temperature_group: utility_monitor.get_temperature_sensors(
+                temperature_group
+            )
+            for temperature_group in TemperatureGroup
+        }
+        self._sensors_displacement = {
+            direction: utility_monitor.get_displacement_sensors(direction)
+            for direction in DisplacementSensorDirection
+        }
+
+        # Sensors and their labels in the same order as the signal data:
+        # ((sensor, label), ...).
+        self._labels_temperature = {
+            temperature_group: tuple(
+                (sensor, self._temperatures[sensor]) for sensor in sensors
+            )
+            for temperature_group, sensors in self._sensors_temperature.items()
+        }
+        self._labels_displacement = {
+            direction: tuple(
+                (sensor, self._displacements[sensor]) for sensor in sensors
+            )
+            for direction, sensors in self._sensors_displacement.items()
+        }
+
+        # Latest utility data received from the signals. The labels are
+        # updated by the timer, so the fast signals are coalesced into one
+        # update per refresh.
+        self._powers_latest: dict[str, tuple] = dict()
+        self._inclinometers_latest: dict[str, float] = dict()
+        self._temperatures_latest: dict[TemperatureGroup, list] = dict()
+        self._displacements_latest: dict[DisplacementSensorDirection, list] = dict()
+
+        # Values shown on the labels. The key is the name of label in
+        # self._power_inclinometer or the sensor's name.
+        self._values_shown: dict[str, float] = dict()
+
+        # Timer to update the utility data on labels
+        self._timer = self.create_and_start_timer(
+            self._callback_time_out, self.model.duration_refresh
+        )
+
+        # The layout is created when the table is shown for the first time
+        self._is_layout_created = False
 
         self._update_power_system_status()
 
@@ -122,10 +188,43 @@ class TabUtilityView(TabDefault):
             indicators[name] = set_button(
                 name, None, is_indicator=True, is_adjust_size=True
             )
-            self._update_indicator_color(indicators[name], False)
+
+        # All the indicators share the same palettes
+        self._palettes_indicator = self._create_palettes_indicator(
+            next(iter(indicators.values()))
+        )
+
+        for indicator in indicators.values():
+            self._update_indicator_color(indicator, False)
 
         return indicators
 
+    def _create_palettes_indicator(
+        self, indicator: QPushButton
+    ) -> dict[bool, QPalette]:
+        """Create the palettes of indicator.
+
+        Parameters
+        ----------
+        indicator : `PySide6.QtWidgets.QPushButton`
+            Indicator.
+
+        Returns
+        -------
+        palettes : `dict` [`bool`, `PySide6.QtGui.QPalette`]
+            Palettes of the indicator. The key is triggered or not.
+        """
+
+        palettes = dict()
+        for triggered, button_status in (
+            (False, ButtonStatus.Default),
+            (True, ButtonStatus.Normal),
+        ):
+            update_button_color(indicator, QPalette.Button, button_status)
+            palettes[triggered] = indicator.palette()
+
+        return palettes
+
     def _update_indicator_color(self, indicator: QPushButton, triggered: bool) -> None:
         """Update the color of indicator.
 
@@ -136,9 +235,7 @@ class TabUtilityView(TabDefault):
         triggered : `bool`
             Is triggered or not.
         """
-
-        button_status = ButtonStatus.Normal if triggered else ButtonStatus.Default
-        update_button_color(indicator, QPalette.Button, button_status)
+        indicator.setPalette(self._palettes_indicator[triggered])
 
     @asyncSlot()
     async def _callback_reset_breakers(self, power_type: MTM2.PowerType) -> None:
@@ -185,6 +282,28 @@ class TabUtilityView(TabDefault):
 
         return labels_sensor_data
 
+    def showEvent(self, event: QShowEvent) -> None:
+        """This is an overridden function to create the layout when the table
+        is shown for the first time.
+
+        Parameters
+        ----------
+        event : `PySide6.QtGui.QShowEvent`
+            Show event.
+        """
+
+        if not self._is_layout_created:
+            # Repaint once after all the groups are added
+            self.setUpdatesEnabled(False)
+            try:
+                self.set_widget_and_layout(is_scrollable=True)
+            finally:
+                self.setUpdatesEnabled(True)
+
+            self._is_layout_created = True
+
+        super().showEvent(event)
+
     def create_layout(self) -> QHBoxLayout:
         """Create the layout.
 
@@ -350,11 +469,7 @@ class TabUtilityView(TabDefault):
 
         layout = QFormLayout()
         for temperature_group in temperature_groups:
-            sensors = self.model.utility_monitor.get_temperature_sensors(
-                temperature_group
-            )
-
-            for sensor in sensors:
+            for sensor in self._sensors_temperature[temperature_group]:
                 layout.addRow(sensor + ":", self._temperatures[sensor])
 
             self.add_empty_row_to_form_layout(layout)
@@ -370,15 +485,10 @@ class TabUtilityView(TabDefault):
             Group.
         """
 
-        layout = QFormLayout()
-
-        sensors_theta = self.model.utility_monitor.get_displacement_sensors(
-            DisplacementSensorDirection.Theta
-        )
-        sensors_delta = self.model.utility_monitor.get_displacement_sensors(
-            DisplacementSensorDirection.Delta
-        )
+        sensors_theta = self._sensors_displacement[DisplacementSensorDirection.Theta]
+        sensors_delta = self._sensors_displacement[DisplacementSensorDirection.Delta]
 
+        layout = QFormLayout()
         for sensor_theta, sensor_delta in zip(sensors_theta, sensors_delta):
             layout.addRow(sensor_theta + ":", self._displacements[sensor_theta])
             layout.addRow(sensor_delta + ":", self._displacements[sensor_delta])
@@ -426,10 +536,7 @@ class TabUtilityView(TabDefault):
             self._callback_update_power_system_status
         )
 
-    @asyncSlot()
-    async def _callback_update_power_system_status(
-        self, is_state_updated: bool
-    ) -> None:
+    def _callback_update_power_system_status(self, is_state_updated: bool) -> None:
         """Callback of the power system signal to update the power system
         status.
 
@@ -451,9 +558,11 @@ class TabUtilityView(TabDefault):
             Signal of the utility.
         """
 
-        signal_utility.power_motor_calibrated.connect(self._callback_power_motor)
+        signal_utility.power_motor_calibrated.connect(
+            partial(self._callback_power, "motor")
+        )
         signal_utility.power_communication_calibrated.connect(
-            self._callback_power_communication
+            partial(self._callback_power, "communication")
         )
 
         signal_utility.inclinometer_raw.connect(self._callback_inclinometer_raw)
@@ -468,40 +577,21 @@ class TabUtilityView(TabDefault):
 
         signal_utility.displacements.connect(self._callback_displacements)
 
-    @asyncSlot()
-    async def _callback_power_motor(self, power_motor: tuple) -> None:
-        """Callback of the utility signal for the motor power.
+    def _callback_power(self, name: str, power: tuple) -> None:
+        """Callback of the utility signal for the motor or communication
+        power.
 
         Parameters
         ----------
-        power_motor : `tuple`
-            Motor power: (voltage, current). The data type is float. The units
-            are volt and ampere respectively.
+        name : `str`
+            Name of the power system: "motor" or "communication".
+        power : `tuple`
+            Power: (voltage, current). The data type is float. The units are
+            volt and ampere respectively.
         """
+        self._powers_latest[name] = power
 
-        self._power_inclinometer["power_voltage_motor"].setText(f"{power_motor[0]} V")
-        self._power_inclinometer["power_current_motor"].setText(f"{power_motor[1]} A")
-
-    @asyncSlot()
-    async def _callback_power_communication(self, power_communication: tuple) -> None:
-        """Callback of the utility signal for the communication power.
-
-        Parameters
-        ----------
-        power_communication : `tuple`
-            Communication power: (voltage, current). The data type is float.
-            The units are volt and ampere respectively.
-        """
-
-        self._power_inclinometer["power_voltage_communication"].setText(
-            f"{power_communication[0]} V"
-        )
-        self._power_inclinometer["power_current_communication"].setText(
-            f"{power_communication[1]} A"
-        )
-
-    @asyncSlot()
-    async def _callback_inclinometer_raw(self, inclinometer_raw: float) -> None:
+    def _callback_inclinometer_raw(self, inclinometer_raw: float) -> None:
         """Callback of the utility signal for the raw inclinometer angle.
 
         Parameters
@@ -509,14 +599,9 @@ class TabUtilityView(TabDefault):
         inclinometer_raw : `float`
             Row inclinometer angle in degree.
         """
-        self._power_inclinometer["inclinometer_raw"].setText(
-            f"{inclinometer_raw} degree"
-        )
+        self._inclinometers_latest["inclinometer_raw"] = inclinometer_raw
 
-    @asyncSlot()
-    async def _callback_inclinometer_processed(
-        self, inclinometer_processed: float
-    ) -> None:
+    def _callback_inclinometer_processed(self, inclinometer_processed: float) -> None:
         """Callback of the utility signal for the processed inclinometer angle.
 
         Parameters
@@ -524,12 +609,9 @@ class TabUtilityView(TabDefault):
         inclinometer_processed : `float`
             Processed inclinometer angle in degree.
         """
-        self._power_inclinometer["inclinometer_processed"].setText(
-            f"{inclinometer_processed} degree"
-        )
+        self._inclinometers_latest["inclinometer_processed"] = inclinometer_processed
 
-    @asyncSlot()
-    async def _callback_inclinometer_tma(self, inclinometer_tma: float) -> None:
+    def _callback_inclinometer_tma(self, inclinometer_tma: float) -> None:
         """Callback of the utility signal for the telescope mount assembly
         (TMA) inclinometer angle.
 
@@ -538,12 +620,9 @@ class TabUtilityView(TabDefault):
         inclinometer_tma : `float`
             Inclinometer angle of TMA in degree.
         """
-        self._power_inclinometer["inclinometer_tma"].setText(
-            f"{inclinometer_tma} degree"
-        )
+        self._inclinometers_latest["inclinometer_tma"] = inclinometer_tma
 
-    @asyncSlot()
-    async def _callback_breakers(self, breaker_status: tuple) -> None:
+    def _callback_breakers(self, breaker_status: tuple) -> None:
         """Callback of the utility signal for the breakers.
 
         Parameters
@@ -556,10 +635,14 @@ class TabUtilityView(TabDefault):
 
         name = breaker_status[0]
         is_triggered = breaker_status[1]
+
+        if self._breakers_triggered[name] == is_triggered:
+            return
+
+        self._breakers_triggered[name] = is_triggered
         self._update_indicator_color(self._breakers[name], is_triggered)
 
-    @asyncSlot()
-    async def _callback_temperatures(self, temperatures: tuple) -> None:
+    def _callback_temperatures(self, temperatures: tuple) -> None:
         """Callback of the utility signal for the temperatures.
 
         Parameters
@@ -575,12 +658,9 @@ class TabUtilityView(TabDefault):
         temperature_group = temperatures[0]
         values = temperatures[1]
 
-        sensors = self.model.utility_monitor.get_temperature_sensors(temperature_group)
-        for sensor, value in zip(sensors, values):
-            self._temperatures[sensor].setText(f"{value} degree C")
+        self._temperatures_latest[temperature_group] = values
 
-    @asyncSlot()
-    async def _callback_displacements(self, displacements: tuple) -> None:
+    def _callback_displacements(self, displacements: tuple) -> None:
         """Callback of the utility signal for the displacements.
 
         Parameters
@@ -596,6 +676,65 @@ class TabUtilityView(TabDefault):
         sensor_direction = displacements[0]
         values = displacements[1]
 
-        sensors = self.model.utility_monitor.get_displacement_sensors(sensor_direction)
-        for sensor, value in zip(sensors, values):
-            self._displacements[sensor].setText(f"{value} mm")
+        self._displacements_latest[sensor_direction] = values
+
+    def _callback_time_out(self) -> None:
+        """Callback timeout function to update the utility data on labels.
+
+        Only the data received since the last timeout is updated, and the
+        label is skipped if its value is not changed. When the table is
+        hidden, the latest data is kept and updated after the table is shown.
+        """
+
+        if self.isVisible():
+            self._update_powers()
+            self._update_inclinometers()
+            self._update_temperatures()
+            self._update_displacements()
+
+        self.check_duration_and_restart_timer(self._timer, self.model.duration_refresh)
+
+    def _update_powers(self) -> None:
+        """Update the latest calibrated powers."""
+
+        for name, power in self._powers_latest.items():
+            for (key, label, unit), value in zip(self._labels_power[name], power):
+                if self._values_shown.get(key) != value:
+                    self._values_shown[key] = value
+                    label.setText(f"{value} {unit}")
+
+        self._powers_latest.clear()
+
+    def _update_inclinometers(self) -> None:
+        """Update the latest inclinometer angles."""
+
+        for name, angle in self._inclinometers_latest.items():
+            if self._values_shown.get(name) != angle:
+                self._values_shown[name] = angle
+                self._power_inclinometer[name].setText(f"{angle} degree")
+
+        self._inclinometers_latest.clear()
+
+    def _update_temperatures(self) -> None:
+        """Update the latest temperatures."""
+
+        for temperature_group, values in self._temperatures_latest.items():
+            labels = self._labels_temperature[temperature_group]
+            for (sensor, label), value in zip(labels, values):
+                if self._values_shown.get(sensor) != value:
+                    self._values_shown[sensor] = value
+                    label.setText(f"{value} degree C")
+
+        self._temperatures_latest.clear()
+
+    def _update_displacements(self) -> None:
+        """Update the latest displacements."""
+
+        for sensor_direction, values in self._displacements_latest.items():
+            labels = self._labels_displacement[sensor_direction]
+            for (sensor, label), value in zip(labels, values):
+                if self._values_shown.get(sensor) != value:
+                    self._values_shown[sensor] = value
+                    label.setText(f"{value} mm")
+
+        self._displacements_latest.clear()
@@ -23,8 +23,11 @@ __all__ = ["ItemActuator"]
 
 from lsst.ts.guitool import Gauge
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QPen
-from PySide6.QtWidgets import QGraphicsEllipseItem, QGraphicsTextItem
+from PySide6.QtGui import QBrush, QFont, QPen
+from PySide6.QtWidgets import QGraphicsEllipseItem, QGraphicsItem, QGraphicsTextItem
+
+# Number of the color steps between the minimal and maximal magnitudes
+NUM_COLOR_STEP = 256
 
 
 class ItemActuator(QGraphicsEllipseItem):
@@ -56,6 +59,18 @@ class ItemActuator(QGraphicsEllipseItem):
         Label of the actuator ID.
     """
 
+    # Brushes of the magnitude ratio from 0 to 1. They are calculated once
+    # instead of on every update of magnitude.
+    _BRUSHES = tuple(
+        QBrush(Gauge.get_color(idx / NUM_COLOR_STEP))
+        for idx in range(NUM_COLOR_STEP + 1)
+    )
+
+    # Fonts of the labels (key: point size) and pens of the actuators (key:
+    # width of pen) that are created on the first use
+    _FONTS: dict[int, QFont] = dict()
+    _PENS: dict[int, QPen] = dict()
+
     def __init__(
         self,
         x: float,
@@ -72,6 +87,10 @@ class ItemActuator(QGraphicsEllipseItem):
 
         self.magnitude = 0.0
 
+        # Index of the brush in self._BRUSHES. The default brush is not in
+        # the table.
+        self._index_brush = -1
+
         # Note that the ItemActuator class will become the parent of
         # self.label_id
         self.label_id = QGraphicsTextItem(str(actuator_id), self)
@@ -89,18 +108,32 @@ class ItemActuator(QGraphicsEllipseItem):
             Width of the pen. (the default is 1)
         """
 
-        font = self.label_id.font()
-        font.setPointSize(point_size)
+        # All actuators share the same font and pen
+        font = self._FONTS.get(point_size)
+        if font is None:
+            font = self.label_id.font()
+            font.setPointSize(point_size)
+            self._FONTS[point_size] = font
+
         self.label_id.setFont(font)
 
-        pen = QPen(Qt.black)
-        pen.setWidth(width_pen)
+        pen = self._PENS.get(width_pen)
+        if pen is None:
+            pen = QPen(Qt.black)
+            pen.setWidth(width_pen)
+            self._PENS[width_pen] = pen
+
         self.setPen(pen)
 
         self.setBrush(Qt.red)
 
         self.setFlag(QGraphicsEllipseItem.ItemIsSelectable)
 
+        # Reuse the rendered ellipse and label until their brush, text, or the
+        # view changes
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        self.label_id.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+
     def set_position_label_id(self, x: float, y: float) -> None:
         """Set the position of actuator ID label.
 
@@ -152,19 +185,32 @@ class ItemActuator(QGraphicsEllipseItem):
         if magnitude_min >= magnitude_max:
             raise ValueError("Minimum magnitude should be less than maximum magnitude.")
 
-        self.magnitude = magnitude
-
         # If the magnitude is out of range, use the limit of range instead
         # to decide the color to show
-        if magnitude > magnitude_max:
-            magnitude_color = magnitude_max
-        elif magnitude < magnitude_min:
-            magnitude_color = magnitude_min
-        else:
-            magnitude_color = magnitude
+        magnitude_color = min(max(magnitude, magnitude_min), magnitude_max)
 
         magnitude_ratio = (magnitude_color - magnitude_min) / (
             magnitude_max - magnitude_min
         )
 
-        self.setBrush(Gauge.get_color(magnitude_ratio))
+        self.set_magnitude(magnitude, round(magnitude_ratio * NUM_COLOR_STEP))
+
+    def set_magnitude(self, magnitude: float, index_brush: int) -> None:
+        """Set the magnitude with the index of color that is already
+        calculated.
+
+        Parameters
+        ----------
+        magnitude : `float`
+            Magnitude.
+        index_brush : `int`
+            Index of the color in the range of [0, NUM_COLOR_STEP]. The minimal
+            magnitude in gauge is 0 and the maximal one is NUM_COLOR_STEP.
+        """
+
+        self.magnitude = magnitude
+
+        # Only repaint when the color is changed
+        if index_brush != self._index_brush:
+            self._index_brush = index_brush
+            self.setBrush(self._BRUSHES[index_brush])
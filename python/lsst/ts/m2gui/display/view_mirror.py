@@ -21,11 +21,15 @@
 
 __all__ = ["ViewMirror"]
 
+import typing
+
+import numpy as np
+import numpy.typing
 from PySide6.QtGui import QFont
 from PySide6.QtWidgets import QGraphicsScene, QGraphicsTextItem, QGraphicsView
 from qasync import asyncSlot
 
-from .item_actuator import ItemActuator
+from .item_actuator import NUM_COLOR_STEP, ItemActuator
 
 
 class ViewMirror(QGraphicsView):
@@ -48,6 +52,14 @@ class ViewMirror(QGraphicsView):
         self._mirror = self._create_mirror()
         super().__init__(self._mirror)
 
+        # Many small actuators change their colors together on every update.
+        # Redrawing the whole viewport is cheaper than collecting the dirty
+        # regions of each of them.
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+
+        # The background is static
+        self.setCacheMode(QGraphicsView.CacheModeFlag.CacheBackground)
+
         self.actuators: list[ItemActuator] = list()
 
         self.mirror_radius = 1
@@ -68,6 +80,10 @@ class ViewMirror(QGraphicsView):
 
         # Create the mirror
         mirror = QGraphicsScene(0, 0, self.SIZE_SCENE, self.SIZE_SCENE)
+        # There are only tens of items on the scene, which does not need the
+        # index to look up the items.
+        mirror.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+
         mirror.selectionChanged.connect(self._show_selected_actuator_force)
 
         # Add the text item to mirror
@@ -139,27 +155,57 @@ class ViewMirror(QGraphicsView):
             Point size of the text. (the default is 8)
         """
 
-        # Calculate the position of actuator on the mirror's view
+        self.add_item_actuators([actuator_id], [alias], [x], [y], point_size=point_size)
+
+    def add_item_actuators(
+        self,
+        actuator_ids: typing.Sequence[int],
+        aliases: typing.Sequence[str],
+        xs: numpy.typing.ArrayLike,
+        ys: numpy.typing.ArrayLike,
+        point_size: int = 8,
+    ) -> None:
+        """Add the actuator items.
+
+        Parameters
+        ----------
+        actuator_ids : `list` [`int`]
+            Actuator IDs.
+        aliases : `list` [`str`]
+            Aliases of the actuators.
+        xs : `numpy.typing.ArrayLike`
+            Actuator x positions in meter.
+        ys : `numpy.typing.ArrayLike`
+            Actuator y positions in meter.
+        point_size : `int`, optional
+            Point size of the text. (the default is 8)
+        """
+
+        # Calculate the positions of actuators on the mirror's view. The
+        # offset of center is to consider the origin of ItemActuator as a
+        # child of QGraphicsEllipseItem
         center = self.SIZE_SCENE // 2
         magnification = self._calculate_magnification()
 
-        # The offset of center is to consider the origin of ItemActuator as a
-        # child of QGraphicsEllipseItem
         offset_center = self.DIAMETER // 2
-        pos_x = center + int(x * magnification) - offset_center
-        pos_y = center + int(y * magnification) - offset_center
+        origin = center - offset_center
+        positions_x = origin + (np.asarray(xs) * magnification).astype(int)
+        positions_y = origin + (np.asarray(ys) * magnification).astype(int)
 
-        actuator = ItemActuator(
-            pos_x, pos_y, self.DIAMETER, actuator_id, alias, point_size
-        )
+        # Offset of the label of actuator ID
+        offset = offset_center - point_size
 
-        # Set the label of actuator ID
-        offset = self.DIAMETER // 2 - point_size
-        actuator.set_position_label_id(pos_x + offset, pos_y)
+        for actuator_id, alias, pos_x, pos_y in zip(
+            actuator_ids, aliases, positions_x.tolist(), positions_y.tolist()
+        ):
+            actuator = ItemActuator(
+                pos_x, pos_y, self.DIAMETER, actuator_id, alias, point_size
+            )
+            actuator.set_position_label_id(pos_x + offset, pos_y)
 
-        self.actuators.append(actuator)
+            self.actuators.append(actuator)
 
-        self._mirror.addItem(actuator)
+            self._mirror.addItem(actuator)
 
     def _calculate_magnification(self, margin: int = 10) -> int:
         """Calculate the magnification. This is to re-dimensition the physical
@@ -179,6 +225,47 @@ class ViewMirror(QGraphicsView):
             self.SIZE_SCENE // 2 - self.DIAMETER // 2 - margin
         ) // self.mirror_radius
 
+    def update_magnitudes(
+        self,
+        magnitudes: numpy.typing.ArrayLike,
+        magnitude_min: float,
+        magnitude_max: float,
+    ) -> None:
+        """Update the magnitudes of the visible actuators. This will update
+        the colors of actuators on the mirror's view. If the magnitude is out
+        of range, the limit of range will be used to show the color.
+
+        Parameters
+        ----------
+        magnitudes : `numpy.typing.ArrayLike`
+            Magnitudes in the order of self.actuators.
+        magnitude_min : `float`
+            Minimal magnitude in gauge.
+        magnitude_max : `float`
+            Maximal magnitude in gauge.
+
+        Raises
+        ------
+        `ValueError`
+            If minimum magnitude >= maximum magnitude.
+        """
+
+        if magnitude_min >= magnitude_max:
+            raise ValueError("Minimum magnitude should be less than maximum magnitude.")
+
+        # Calculate the indexes of colors of all actuators at once
+        magnitudes = np.asarray(magnitudes, dtype=float)
+        indexes_brush = np.rint(
+            (np.clip(magnitudes, magnitude_min, magnitude_max) - magnitude_min)
+            * (NUM_COLOR_STEP / (magnitude_max - magnitude_min))
+        ).astype(int)
+
+        for actuator, magnitude, index_brush in zip(
+            self.actuators, magnitudes.tolist(), indexes_brush.tolist()
+        ):
+            if actuator.isVisible():
+                actuator.set_magnitude(magnitude, index_brush)
+
     def show_alias(self, is_alias: bool) -> None:
         """Show the alias of actuator or not.
 
@@ -129,7 +129,7 @@ class FaultManager(object):
             True if there is the error. Otherwise, False.
         """
 
-        return len(self.errors) != 0
+        return bool(self.errors)
 
     def reset_limit_switch_status(self, limit_switch_type: LimitSwitchType) -> None:
         """Reset the limit switch status.
@@ -195,11 +195,12 @@ class FaultManager(object):
             raise ValueError(f"Unsupported limit switch type: {limit_switch_type!r}.")
 
         name = ring.name + str(number)
-        if name in limit_switch_status.keys():
-            if limit_switch_status[name] != new_status:
-                limit_switch_status[name] = new_status
-                self.signal_limit_switch.type_name_status.emit(
-                    (limit_switch_type, name, new_status)
-                )
-        else:
+        status = limit_switch_status.get(name)
+        if status is None:
             raise ValueError(f"The limit switch: {name} is not in the list.")
+
+        if status != new_status:
+            limit_switch_status[name] = new_status
+            self.signal_limit_switch.type_name_status.emit(
+                (limit_switch_type, name, new_status)
+            )
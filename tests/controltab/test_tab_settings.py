@@ -21,6 +21,7 @@
 
 import asyncio
 import logging
+import typing
 
 import pytest
 from lsst.ts.guitool import (
@@ -37,6 +38,7 @@ from lsst.ts.guitool import (
 from lsst.ts.m2gui import Model
 from lsst.ts.m2gui.controltab import TabSettings
 from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QAbstractSpinBox, QGroupBox
 from pytestqt.qtbot import QtBot
 from qasync import QApplication
 
@@ -52,8 +54,8 @@ def widget(qtbot: QtBot) -> TabSettings:
 def test_init(widget: TabSettings) -> None:
     controller = widget.model.controller
     assert widget._settings["host"].text() == controller.host
-    assert widget._settings["port_command"].value() == controller.port_command
-    assert widget._settings["port_telemetry"].value() == controller.port_telemetry
+    assert widget._settings["port_command"].text() == str(controller.port_command)
+    assert widget._settings["port_telemetry"].text() == str(controller.port_telemetry)
     assert (
         widget._settings["timeout_connection"].value() == controller.timeout_connection
     )
@@ -75,38 +77,58 @@ def test_init(widget: TabSettings) -> None:
     assert widget._settings["point_size"].value() == app.font().pointSize()
 
     for port in ("port_command", "port_telemetry"):
-        assert widget._settings[port].minimum() == PORT_MINIMUM
-        assert widget._settings[port].maximum() == PORT_MAXIMUM
+        validator = widget._settings[port].validator()
+        assert validator.bottom() == PORT_MINIMUM
+        assert validator.top() == PORT_MAXIMUM
 
     assert widget._settings["timeout_connection"].minimum() == TIMEOUT_MINIMUM
 
     assert widget._settings["log_level"].minimum() == LOG_LEVEL_MINIMUM
     assert widget._settings["log_level"].maximum() == LOG_LEVEL_MAXIMUM
 
+    assert widget._settings["refresh_frequency"].minimum() == REFRESH_FREQUENCY_MINIMUM
+    assert widget._settings["refresh_frequency"].maximum() == REFRESH_FREQUENCY_MAXIMUM
+
+    assert widget._settings["point_size"].minimum() == POINT_SIZE_MINIMUM
+    assert widget._settings["point_size"].maximum() == POINT_SIZE_MAXIMUM
+
+    for setting in widget._settings.values():
+        if isinstance(setting, QAbstractSpinBox):
+            assert setting.keyboardTracking() is False
+
+
+def test_show_event(widget: TabSettings) -> None:
+    # The setting widgets are put into the groups when the layout is created
     line_edit = widget._settings["host"]
+    assert isinstance(line_edit.parentWidget(), QGroupBox) is False
+
+    widget.show()
+
+    group = line_edit.parentWidget()
+    assert isinstance(group, QGroupBox) is True
+
     font_metrics = line_edit.fontMetrics()
     assert (
         line_edit.minimumWidth()
-        == font_metrics.boundingRect(line_edit.text()).width() + 20
+        == font_metrics.horizontalAdvance(line_edit.text()) + 20
     )
 
-    assert widget._settings["refresh_frequency"].minimum() == REFRESH_FREQUENCY_MINIMUM
-    assert widget._settings["refresh_frequency"].maximum() == REFRESH_FREQUENCY_MAXIMUM
+    # The layout should only be created once
+    widget.hide()
+    widget.show()
 
-    assert widget._settings["point_size"].minimum() == POINT_SIZE_MINIMUM
-    assert widget._settings["point_size"].maximum() == POINT_SIZE_MAXIMUM
+    assert line_edit.parentWidget() is group
 
 
-@pytest.mark.asyncio
-async def test_callback_use_external_elevation_angle(widget: TabSettings) -> None:
+def test_callback_use_external_elevation_angle(widget: TabSettings) -> None:
     # Use the external elevation angle
-    await widget._callback_use_external_elevation_angle(Qt.CheckState.Checked.value)
+    widget._callback_use_external_elevation_angle(Qt.CheckState.Checked.value)
 
     assert widget._settings["enable_angle_comparison"].isChecked() is True
     assert widget._settings["enable_angle_comparison"].isEnabled() is False
 
     # Use the internal elevation angle
-    await widget._callback_use_external_elevation_angle(Qt.CheckState.Unchecked.value)
+    widget._callback_use_external_elevation_angle(Qt.CheckState.Unchecked.value)
 
     assert widget._settings["enable_angle_comparison"].isEnabled() is True
 
@@ -114,8 +136,8 @@ async def test_callback_use_external_elevation_angle(widget: TabSettings) -> Non
 @pytest.mark.asyncio
 async def test_callback_apply_host(qtbot: QtBot, widget: TabSettings) -> None:
     widget._settings["host"].setText("newHost")
-    widget._settings["port_command"].setValue(1)
-    widget._settings["port_telemetry"].setValue(2)
+    widget._settings["port_command"].setText("1")
+    widget._settings["port_telemetry"].setText("2")
     widget._settings["timeout_connection"].setValue(3)
 
     qtbot.mouseClick(widget._button_apply_host, Qt.LeftButton)
@@ -130,6 +152,62 @@ async def test_callback_apply_host(qtbot: QtBot, widget: TabSettings) -> None:
     assert controller.timeout_connection == 3
 
 
+@pytest.mark.asyncio
+async def test_callback_apply_host_unchanged(
+    qtbot: QtBot, widget: TabSettings, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Record the applied connection information instead of applying it
+    calls = list()
+
+    def update_connection_information(*args: typing.Any) -> None:
+        calls.append(args)
+
+    monkeypatch.setattr(
+        widget.model, "update_connection_information", update_connection_information
+    )
+
+    # The unchanged values should be skipped when disconnected
+    qtbot.mouseClick(widget._button_apply_host, Qt.LeftButton)
+
+    # Sleep so the event loop can access CPU to handle the signal
+    await asyncio.sleep(1)
+
+    assert calls == []
+
+    # The model should still be called when connected, so the user is told
+    # to disconnect first
+    widget.model.update_system_status("isCrioConnected", True)
+
+    qtbot.mouseClick(widget._button_apply_host, Qt.LeftButton)
+
+    # Sleep so the event loop can access CPU to handle the signal
+    await asyncio.sleep(1)
+
+    controller = widget.model.controller
+    assert calls == [
+        (
+            controller.host,
+            controller.port_command,
+            controller.port_telemetry,
+            controller.timeout_connection,
+        )
+    ]
+
+
+def test_port_group_separator(widget: TabSettings) -> None:
+    for port in ("port_command", "port_telemetry"):
+        line_edit = widget._settings[port]
+
+        # The port with the group separator should be rejected instead of
+        # failing the conversion later
+        for text in ("1,000", "1.000"):
+            line_edit.setText(text)
+            assert line_edit.hasAcceptableInput() is False
+
+        line_edit.setText("1000")
+        assert line_edit.hasAcceptableInput() is True
+
+
 @pytest.mark.asyncio
 async def test_callback_apply_ilc(qtbot: QtBot, widget: TabSettings) -> None:
     widget._settings["ilc_retry_times"].setValue(10)
@@ -162,6 +240,31 @@ async def test_callback_apply_general(qtbot: QtBot, widget: TabSettings) -> None
     assert app.font().pointSize() == 12
 
 
+@pytest.mark.asyncio
+async def test_callback_apply_general_font_changed(
+    qtbot: QtBot, widget: TabSettings
+) -> None:
+    # The application font is changed outside of the table
+    app = QApplication.instance()
+    font_original = app.font()
+
+    font = app.font()
+    font.setBold(True)
+    app.setFont(font)
+
+    widget._settings["point_size"].setValue(font.pointSize() + 1)
+
+    qtbot.mouseClick(widget._button_apply_general, Qt.LeftButton)
+
+    # Sleep so the event loop can access CPU to handle the signal
+    await asyncio.sleep(1)
+
+    assert app.font().pointSize() == font.pointSize() + 1
+    assert app.font().bold() is True
+
+    app.setFont(font_original)
+
+
 @pytest.mark.asyncio
 async def test_callback_signal_config_temperature_offset(widget: TabSettings) -> None:
     offset = 10.1
@@ -171,3 +274,83 @@ async def test_callback_signal_config_temperature_offset(widget: TabSettings) ->
     await asyncio.sleep(1)
 
     assert widget._settings["lut_temperature_ref"].value() == offset
+
+
+@pytest.mark.asyncio
+async def test_callback_overwrite_external_elevation_angle(
+    widget: TabSettings, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Record the written angles instead of sending them to the controller
+    angles = list()
+
+    async def set_external_elevation_angle(angle: float) -> None:
+        angles.append(angle)
+
+    monkeypatch.setattr(
+        widget.model.controller,
+        "set_external_elevation_angle",
+        set_external_elevation_angle,
+    )
+
+    widget._settings["external_elevation_angle"].setValue(10.0)
+
+    # The timer should write the angle while the button is checked
+    button = widget._button_overwrite_external_elevation_angle
+    button.click()
+
+    # Sleep so the event loop can access CPU to handle the signal
+    await asyncio.sleep(1)
+
+    assert button.isChecked() is True
+    assert len(angles) > 0
+    assert set(angles) == {10.0}
+
+    # The timer should stop the writing when the button is unchecked
+    button.click()
+
+    # Sleep so the event loop can access CPU to handle the signal
+    await asyncio.sleep(1)
+
+    assert button.isChecked() is False
+
+    num_angles = len(angles)
+    await asyncio.sleep(1)
+
+    assert len(angles) == num_angles
+
+
+@pytest.mark.asyncio
+async def test_callback_time_out(
+    widget: TabSettings, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Hold the writing of the angle until it is released
+    angles = list()
+    is_released = asyncio.Event()
+
+    async def set_external_elevation_angle(angle: float) -> None:
+        angles.append(angle)
+        await is_released.wait()
+
+    monkeypatch.setattr(
+        widget.model.controller,
+        "set_external_elevation_angle",
+        set_external_elevation_angle,
+    )
+
+    widget._settings["external_elevation_angle"].setValue(10.0)
+    widget._button_overwrite_external_elevation_angle.click()
+
+    # Sleep so the event loop can access CPU to handle the signal
+    await asyncio.sleep(1)
+
+    # The timeouts should not schedule another writing while the previous
+    # one is not done
+    assert angles == [10.0]
+
+    # The writing should continue after the previous one is done
+    is_released.set()
+    await asyncio.sleep(1)
+
+    assert len(angles) > 1
+
+    widget._button_overwrite_external_elevation_angle.click()
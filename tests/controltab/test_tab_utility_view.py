@@ -29,6 +29,7 @@ from lsst.ts.m2gui.controltab import TabUtilityView
 from lsst.ts.xml.enums import MTM2
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QPalette
+from PySide6.QtWidgets import QGroupBox
 from pytestqt.qtbot import QtBot
 
 
@@ -66,6 +67,23 @@ def test_init(widget: TabUtilityView) -> None:
     )
 
 
+def test_show_event(widget: TabUtilityView) -> None:
+    # The labels are put into the groups when the layout is created
+    label = widget._power_inclinometer["inclinometer_tma"]
+    assert isinstance(label.parentWidget(), QGroupBox) is False
+
+    widget.show()
+
+    group = label.parentWidget()
+    assert isinstance(group, QGroupBox) is True
+
+    # The layout should only be created once
+    widget.hide()
+    widget.show()
+
+    assert label.parentWidget() is group
+
+
 @pytest.mark.asyncio
 async def test_callback_reset_breakers(widget_async: TabUtilityView) -> None:
     # Transition to Enabled state to turn on the communication power
@@ -87,6 +105,8 @@ async def test_callback_reset_breakers(widget_async: TabUtilityView) -> None:
 
 @pytest.mark.asyncio
 async def test_callback_power_motor(qtbot: QtBot, widget: TabUtilityView) -> None:
+    widget.show()
+
     widget.model.utility_monitor.update_power_calibrated(MTM2.PowerType.Motor, 0.1, 0.2)
 
     # Sleep so the event loop can access CPU to handle the signal
@@ -100,6 +120,8 @@ async def test_callback_power_motor(qtbot: QtBot, widget: TabUtilityView) -> Non
 async def test_callback_power_communication(
     qtbot: QtBot, widget: TabUtilityView
 ) -> None:
+    widget.show()
+
     widget.model.utility_monitor.update_power_calibrated(
         MTM2.PowerType.Communication, 0.1, 0.2
     )
@@ -113,6 +135,8 @@ async def test_callback_power_communication(
 
 @pytest.mark.asyncio
 async def test_callback_inclinometer(widget: TabUtilityView) -> None:
+    widget.show()
+
     widget.model.utility_monitor.update_inclinometer_angle(
         0.1, new_angle_processed=0.55
     )
@@ -126,6 +150,8 @@ async def test_callback_inclinometer(widget: TabUtilityView) -> None:
 
 @pytest.mark.asyncio
 async def test_callback_inclinometer_tma(widget: TabUtilityView) -> None:
+    widget.show()
+
     widget.model.utility_monitor.update_inclinometer_angle(0.1, is_internal=False)
 
     # Sleep so the event loop can access CPU to handle the signal
@@ -149,6 +175,8 @@ async def test_callback_breakers(qtbot: QtBot, widget: TabUtilityView) -> None:
 
 @pytest.mark.asyncio
 async def test_callback_temperatures(qtbot: QtBot, widget: TabUtilityView) -> None:
+    widget.show()
+
     temperature_group = TemperatureGroup.LG3
     temperatures = list(range(1, 5))
 
@@ -165,6 +193,8 @@ async def test_callback_temperatures(qtbot: QtBot, widget: TabUtilityView) -> No
 
 @pytest.mark.asyncio
 async def test_callback_displacements(qtbot: QtBot, widget: TabUtilityView) -> None:
+    widget.show()
+
     direction = DisplacementSensorDirection.Delta
     displacements = list(range(1, 7))
 
@@ -177,3 +207,42 @@ async def test_callback_displacements(qtbot: QtBot, widget: TabUtilityView) -> N
     sensors = utility_monitor.get_displacement_sensors(direction)
     for sensor, displacement in zip(sensors, displacements):
         assert widget._displacements[sensor].text() == f"{displacement} mm"
+
+
+def test_callback_time_out(widget: TabUtilityView) -> None:
+    widget.show()
+
+    signal = widget.model.utility_monitor.signal_utility.inclinometer_tma
+    label = widget._power_inclinometer["inclinometer_tma"]
+    text = label.text()
+
+    # The label should only be updated with the latest value on timeout
+    signal.emit(0.2)
+    signal.emit(0.3)
+
+    assert label.text() == text
+
+    widget._callback_time_out()
+
+    assert label.text() == "0.3 degree"
+
+    # The label should not be updated if the value is not changed
+    label.setText("")
+    signal.emit(0.3)
+
+    widget._callback_time_out()
+
+    assert label.text() == ""
+
+    # The latest data should be kept when the table is hidden
+    widget.hide()
+    signal.emit(0.4)
+
+    widget._callback_time_out()
+
+    assert label.text() == ""
+
+    widget.show()
+    widget._callback_time_out()
+
+    assert label.text() == "0.4 degree"
@@ -21,6 +21,8 @@
 
 import pytest
 from lsst.ts.m2gui.display import ItemActuator, ViewMirror
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QGraphicsItem, QGraphicsScene, QGraphicsView
 from pytestqt.qtbot import QtBot
 
 
@@ -34,6 +36,15 @@ def widget(qtbot: QtBot) -> ViewMirror:
     return widget
 
 
+def test_init(widget: ViewMirror) -> None:
+    assert (
+        widget.viewportUpdateMode()
+        == QGraphicsView.ViewportUpdateMode.FullViewportUpdate
+    )
+    assert widget.cacheMode() == QGraphicsView.CacheModeFlag.CacheBackground
+    assert widget.scene().itemIndexMethod() == QGraphicsScene.ItemIndexMethod.NoIndex
+
+
 @pytest.mark.asyncio
 async def test_show_selected_actuator_force(widget: ViewMirror) -> None:
     text_force = widget.get_text_force()
@@ -68,6 +79,21 @@ def test_add_item_actuator(widget: ViewMirror) -> None:
     assert len(widget.actuators) == 1
 
 
+def test_add_item_actuators(widget: ViewMirror) -> None:
+    widget.add_item_actuators([2, 3], ["alias2", "alias3"], [0.5, -0.5], [0, 0])
+
+    assert len(widget.actuators) == 3
+
+    actuator_2, actuator_3 = widget.actuators[1:]
+    assert actuator_2.acutator_id == 2
+    assert actuator_2.rect().x() == 344
+    assert actuator_2.rect().y() == 233
+
+    assert actuator_3.acutator_id == 3
+    assert actuator_3.rect().x() == 122
+    assert actuator_3.label_id.x() == 122 + widget.DIAMETER // 2 - 8
+
+
 def test_show_alias(widget: ViewMirror) -> None:
     actuator = widget.actuators[0]
 
@@ -85,6 +111,20 @@ def test_item_actuator(widget: ViewMirror) -> None:
     assert actuator.rect().y() == 344
 
     assert actuator.pen().width() == 1
+    assert actuator.pen().color() == Qt.black
+    assert actuator.label_id.font().pointSize() == 8
+
+    # The actuators should have the same pen and font
+    widget.add_item_actuator(2, "alias2", 0.5, 0)
+    actuator_2 = widget.actuators[1]
+
+    assert actuator_2.pen() == actuator.pen()
+    assert actuator_2.label_id.font() == actuator.label_id.font()
+
+    assert actuator.cacheMode() == QGraphicsItem.CacheMode.DeviceCoordinateCache
+    assert (
+        actuator.label_id.cacheMode() == QGraphicsItem.CacheMode.DeviceCoordinateCache
+    )
 
     assert (
         actuator.label_id.x()
@@ -114,3 +154,35 @@ def test_item_actuator_update_magnitude(widget: ViewMirror) -> None:
 
     actuator.update_magnitude(-750, -700, 700)
     assert actuator.brush().color().hue() == 240
+
+    # The same brush should be used if the magnitude is out of range
+    brush = actuator.brush()
+
+    actuator.update_magnitude(-800, -700, 700)
+
+    assert actuator.magnitude == -800
+    assert actuator.brush() == brush
+
+
+def test_update_magnitudes_exception(widget: ViewMirror) -> None:
+    with pytest.raises(ValueError):
+        widget.update_magnitudes([0], 1, 1)
+
+
+def test_update_magnitudes(widget: ViewMirror) -> None:
+    actuator = widget.actuators[0]
+
+    widget.update_magnitudes([0], -700, 700)
+    assert actuator.magnitude == 0
+    assert actuator.brush().color().hue() == 150
+
+    widget.update_magnitudes([-800], -700, 700)
+    assert actuator.magnitude == -800
+    assert actuator.brush().color().hue() == 240
+
+    # The hidden actuator should not be updated
+    actuator.setVisible(False)
+    widget.update_magnitudes([750], -700, 700)
+
+    assert actuator.magnitude == -800
+    assert actuator.brush().color().hue() == 240